@@ -2,44 +2,60 @@
 CRUD (Create, Read, Update, Delete) operations module for Todo items.
 
 This module contains all database operations for managing todo items.
-It provides functions to interact with the database through SQLAlchemy ORM,
-abstracting the database logic from the API endpoints.
+It provides async functions to interact with the database through SQLAlchemy's
+asyncio ORM extension, abstracting the database logic from the API endpoints.
 
 Functions:
     get_todos: Retrieve all todo items from the database.
     get_todo_by_id: Retrieve a specific todo item by its ID.
     create_todo: Create a new todo item in the database.
+    create_todos_bulk: Create multiple todo items in one round-trip.
     update_todo: Update an existing todo item.
     delete_todo: Delete a todo item from the database.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from app import models, schemas
 
-def get_todos(db: Session):
+async def get_todos(db: AsyncSession, limit: int = 50, cursor: int | None = None):
     """
-    Retrieve all todo items from the database.
+    Retrieve a page of todo items from the database.
 
-    Fetches all todo items ordered by creation date in descending order
-    (newest first). This provides a consistent ordering for the todo list.
+    Fetches todo items ordered by creation date in descending order
+    (newest first, with id as a tiebreaker for a stable ordering). Pages
+    are selected by keyset: passing the id of the last item of the
+    previous page as the cursor returns the items after it. Unlike an
+    OFFSET, the keyset predicate stays index-friendly however deep the
+    client pages.
 
     Args:
-        db (Session): SQLAlchemy database session for executing queries.
+        db (AsyncSession): SQLAlchemy async database session for executing queries.
+        limit (int): Maximum number of todo items to return. Defaults to 50.
+        cursor (int | None): Id of the last todo of the previous page, or
+                             None for the first page.
 
     Returns:
-        list[models.Todo]: A list of all todo items in the database,
-                           ordered by creation date (newest first).
+        list[models.Todo]: A page of todo items, ordered by creation
+                           date (newest first).
 
     Examples:
         >>> from app.database import SessionLocal
-        >>> db = SessionLocal()
-        >>> todos = get_todos(db)
-        >>> print(f"Found {len(todos)} todos")
-        Found 5 todos
+        >>> async with SessionLocal() as db:
+        >>>     page = await get_todos(db, limit=20)
+        >>>     next_page = await get_todos(db, limit=20, cursor=page[-1].id)
     """
-    return db.query(models.Todo).order_by(models.Todo.created_at.desc()).all()
+    stmt = (
+        select(models.Todo)
+        .order_by(models.Todo.created_at.desc(), models.Todo.id.desc())
+        .limit(limit)
+    )
+    if cursor is not None:
+        stmt = stmt.where(models.Todo.id < cursor)
+    result = await db.execute(stmt)
+    return result.scalars().all()
 
-def get_todo_by_id(db: Session, todo_id: int):
+async def get_todo_by_id(db: AsyncSession, todo_id: int):
     """
     Retrieve a specific todo item by its unique identifier.
 
@@ -47,32 +63,32 @@ def get_todo_by_id(db: Session, todo_id: int):
     it if found, or None if no matching todo exists.
 
     Args:
-        db (Session): SQLAlchemy database session for executing queries.
+        db (AsyncSession): SQLAlchemy async database session for executing queries.
         todo_id (int): The unique identifier of the todo item to retrieve.
 
     Returns:
         models.Todo | None: The todo item if found, None otherwise.
 
     Examples:
-        >>> db = SessionLocal()
-        >>> todo = get_todo_by_id(db, 1)
-        >>> if todo:
-        >>>     print(f"Found: {todo.title}")
-        >>> else:
-        >>>     print("Todo not found")
+        >>> async with SessionLocal() as db:
+        >>>     todo = await get_todo_by_id(db, 1)
+        >>>     if todo:
+        >>>         print(f"Found: {todo.title}")
+        >>>     else:
+        >>>         print("Todo not found")
     """
-    return db.query(models.Todo).filter(models.Todo.id == todo_id).first()
+    return await db.get(models.Todo, todo_id)
 
-def create_todo(db: Session, todo: schemas.TodoCreate):
+async def create_todo(db: AsyncSession, todo: schemas.TodoCreate):
     """
     Create a new todo item in the database.
 
-    Takes a TodoCreate schema, creates a new Todo model instance,
-    adds it to the database, commits the transaction, and returns
-    the created todo with its generated ID.
+    Takes a TodoCreate schema and inserts the row with a single
+    INSERT ... OUTPUT statement, so the generated fields come back with
+    the insert instead of a follow-up refresh SELECT.
 
     Args:
-        db (Session): SQLAlchemy database session for executing queries.
+        db (AsyncSession): SQLAlchemy async database session for executing queries.
         todo (schemas.TodoCreate): Pydantic schema containing the todo data
                                    to be created (title and description).
 
@@ -82,31 +98,69 @@ def create_todo(db: Session, todo: schemas.TodoCreate):
 
     Examples:
         >>> from app.schemas import TodoCreate
-        >>> db = SessionLocal()
-        >>> new_todo = TodoCreate(title="Buy milk", description="From the store")
-        >>> created = create_todo(db, new_todo)
-        >>> print(f"Created todo with ID: {created.id}")
+        >>> async with SessionLocal() as db:
+        >>>     new_todo = TodoCreate(title="Buy milk", description="From the store")
+        >>>     created = await create_todo(db, new_todo)
+        >>>     print(f"Created todo with ID: {created.id}")
         Created todo with ID: 1
     """
-    db_todo = models.Todo(
-        title=todo.title,
-        description=todo.description
+    result = await db.execute(
+        insert(models.Todo)
+        .values(title=todo.title, description=todo.description)
+        .returning(models.Todo)
     )
-    db.add(db_todo)
-    db.commit()
-    db.refresh(db_todo)
+    db_todo = result.scalar_one()
+    await db.commit()
     return db_todo
 
-def update_todo(db: Session, todo_id: int, todo: schemas.TodoUpdate):
+async def create_todos_bulk(db: AsyncSession, todos: list[schemas.TodoCreate]):
+    """
+    Create multiple todo items in a single database round-trip.
+
+    Inserts all the given todos with one INSERT ... OUTPUT statement and
+    a single commit, instead of one round-trip and commit per item, and
+    returns the created rows with their generated ids and timestamps.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session for executing queries.
+        todos (list[schemas.TodoCreate]): Pydantic schemas containing the
+                                          todo data to be created.
+
+    Returns:
+        list[models.Todo]: The newly created todo items including
+                           auto-generated fields, in insertion order.
+
+    Examples:
+        >>> from app.schemas import TodoCreate
+        >>> async with SessionLocal() as db:
+        >>>     created = await create_todos_bulk(db, [
+        >>>         TodoCreate(title="Buy milk"),
+        >>>         TodoCreate(title="Walk the dog"),
+        >>>     ])
+        >>>     print(f"Created {len(created)} todos")
+        Created 2 todos
+    """
+    if not todos:
+        return []
+    result = await db.execute(
+        insert(models.Todo).returning(models.Todo, sort_by_parameter_order=True),
+        [todo.model_dump() for todo in todos],
+    )
+    db_todos = result.scalars().all()
+    await db.commit()
+    return db_todos
+
+async def update_todo(db: AsyncSession, todo_id: int, todo: schemas.TodoUpdate):
     """
     Update an existing todo item in the database.
 
     Performs a partial update of a todo item, only modifying the fields
-    that are provided in the TodoUpdate schema. If a field is None, it
-    won't be updated. Returns the updated todo or None if not found.
+    that were provided in the TodoUpdate schema. The update is issued as a
+    single UPDATE ... OUTPUT statement so no separate SELECT or refresh
+    round-trips are needed. Returns the updated todo or None if not found.
 
     Args:
-        db (Session): SQLAlchemy database session for executing queries.
+        db (AsyncSession): SQLAlchemy async database session for executing queries.
         todo_id (int): The unique identifier of the todo item to update.
         todo (schemas.TodoUpdate): Pydantic schema containing the fields
                                    to update. All fields are optional.
@@ -117,34 +171,44 @@ def update_todo(db: Session, todo_id: int, todo: schemas.TodoUpdate):
 
     Examples:
         >>> from app.schemas import TodoUpdate
-        >>> db = SessionLocal()
-        >>> update_data = TodoUpdate(is_completed=True)
-        >>> updated = update_todo(db, 1, update_data)
-        >>> if updated:
-        >>>     print(f"Todo {updated.id} marked as completed")
+        >>> async with SessionLocal() as db:
+        >>>     update_data = TodoUpdate(is_completed=True)
+        >>>     updated = await update_todo(db, 1, update_data)
+        >>>     if updated:
+        >>>         print(f"Todo {updated.id} marked as completed")
     """
-    db_todo = get_todo_by_id(db, todo_id)
-    if db_todo:
-        if todo.title is not None:
-            db_todo.title = todo.title
-        if todo.description is not None:
-            db_todo.description = todo.description
-        if todo.is_completed is not None:
-            db_todo.is_completed = todo.is_completed
-        db.commit()
-        db.refresh(db_todo)
+    # Ignore fields that are unset or explicitly null: every column has
+    # update-to-NULL semantics the API never exposes (title and
+    # is_completed are NOT NULL), matching the original field-by-field
+    # "if not None" assignment
+    values = {
+        field: value
+        for field, value in todo.model_dump(exclude_unset=True).items()
+        if value is not None
+    }
+    if not values:
+        # Nothing to change; just report whether the todo exists
+        return await get_todo_by_id(db, todo_id)
+    result = await db.execute(
+        update(models.Todo)
+        .where(models.Todo.id == todo_id)
+        .values(**values)
+        .returning(models.Todo)
+    )
+    db_todo = result.scalar_one_or_none()
+    await db.commit()
     return db_todo
 
-def delete_todo(db: Session, todo_id: int):
+async def delete_todo(db: AsyncSession, todo_id: int):
     """
     Delete a todo item from the database.
 
-    Finds and removes a todo item with the given ID from the database.
-    The operation is committed immediately. Returns the deleted todo
-    or None if the todo wasn't found.
+    Removes the todo item with the given ID in a single
+    DELETE ... OUTPUT statement and commits immediately. Returns the
+    deleted todo or None if the todo wasn't found.
 
     Args:
-        db (Session): SQLAlchemy database session for executing queries.
+        db (AsyncSession): SQLAlchemy async database session for executing queries.
         todo_id (int): The unique identifier of the todo item to delete.
 
     Returns:
@@ -152,19 +216,22 @@ def delete_todo(db: Session, todo_id: int):
                             None if the todo with the given ID doesn't exist.
 
     Examples:
-        >>> db = SessionLocal()
-        >>> deleted = delete_todo(db, 1)
-        >>> if deleted:
-        >>>     print(f"Deleted todo: {deleted.title}")
-        >>> else:
-        >>>     print("Todo not found")
+        >>> async with SessionLocal() as db:
+        >>>     deleted = await delete_todo(db, 1)
+        >>>     if deleted:
+        >>>         print(f"Deleted todo: {deleted.title}")
+        >>>     else:
+        >>>         print("Todo not found")
 
     Notes:
         - The deletion is permanent and cannot be undone
-        - The deleted todo object is returned before being removed from the session
+        - The deleted row's data is returned by the OUTPUT clause
     """
-    db_todo = get_todo_by_id(db, todo_id)
-    if db_todo:
-        db.delete(db_todo)
-        db.commit()
+    result = await db.execute(
+        delete(models.Todo)
+        .where(models.Todo.id == todo_id)
+        .returning(models.Todo)
+    )
+    db_todo = result.scalar_one_or_none()
+    await db.commit()
     return db_todo
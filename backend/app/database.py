@@ -3,14 +3,15 @@ Database configuration and session management module.
 
 This module handles all database-related configuration including connection
 strings, engine creation, session management, and database initialization.
-It uses SQLAlchemy for ORM functionality and connects to a SQL Server database.
+It uses SQLAlchemy's asyncio extension for ORM functionality and connects to
+a SQL Server database through the aioodbc driver so database round-trips
+never block the event loop.
 
 Attributes:
-    master_connection_string (str): Connection string for SQL Server master database.
     connection_string (str): Connection string for the TodoDB database.
     DATABASE_URL (str): SQLAlchemy database URL with ODBC driver.
-    engine (Engine): SQLAlchemy engine instance for database operations.
-    SessionLocal (sessionmaker): Factory for creating database sessions.
+    engine (AsyncEngine): SQLAlchemy async engine instance for database operations.
+    SessionLocal (async_sessionmaker): Factory for creating async database sessions.
     Base (DeclarativeMeta): Base class for SQLAlchemy models.
 
 Functions:
@@ -18,82 +19,119 @@ Functions:
     get_db: Dependency function that provides database sessions to endpoints.
 """
 
-from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from urllib.parse import quote_plus
-import pyodbc
 import os
+import pyodbc
+import tempfile
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; the first-boot lock is skipped there and
+    # the conditional CREATE DATABASE below is idempotent anyway
+    fcntl = None
+
 # Load environment variables from backend/.env
 load_dotenv()
 
-# SQL Server connection string with Windows Authentication (master database)
-# Move these into the .env file: MASTER_CONNECTION_STRING and TODO_DB_CONNECTION_STRING
-# master_connection_string = os.getenv(
-#     "MASTER_CONNECTION_STRING" 
-# )
+# SQL Server connection string for the master database, used only to
+# create TodoDB on first boot. Optional: leave unset when the database
+# is provisioned out of band.
+master_connection_string = os.getenv("MASTER_CONNECTION_STRING")
 
 # SQL Server connection string for TodoDB
 connection_string = os.getenv("TODO_DB_CONNECTION_STRING")
- 
-# Function to ensure database exists
-#def ensure_database_exists():
-    # try:
-        # Connect to master database
-        # conn = pyodbc.connect(master_connection_string)
-        # conn.autocommit = True
-        # cursor = conn.cursor()
-
-        # Check if database exists
-        # cursor.execute("SELECT database_id FROM sys.databases WHERE Name = 'TodoDB'")
-        # if not cursor.fetchone():
-        #     # Create database if it doesn't exist
-        #     cursor.execute("CREATE DATABASE TodoDB")
-        #     print("Database 'TodoDB' created successfully")
-        # else:
-        #     print("Database 'TodoDB' already exists")
-
-    #     # cursor.close()
-    #     # conn.close()
-    # except Exception as e:
-    #     print(f"Error ensuring database exists: {e}")
-
-# Create SQLAlchemy engine
-DATABASE_URL = f"mssql+pyodbc:///?odbc_connect={quote_plus(connection_string)}"
-engine = create_engine(DATABASE_URL, echo=True)
+
+# Set once ensure_database_exists has run so repeat calls return
+# immediately instead of paying the ODBC login handshake again
+_db_ensured = False
+
+_INIT_LOCK_PATH = os.path.join(tempfile.gettempdir(), "todo_db_init.lock")
+
+def ensure_database_exists():
+    """
+    Create the TodoDB database if it doesn't exist yet.
+
+    Connects to the master database and issues a single conditional
+    CREATE DATABASE statement. The result is cached in a module-level
+    flag, and a file lock serializes the check across workers so only
+    one process attempts the creation on multi-worker deploys.
+
+    Notes:
+        - Does nothing when MASTER_CONNECTION_STRING is not configured
+        - Safe to call multiple times; only the first call does any work
+    """
+    global _db_ensured
+    if _db_ensured:
+        return
+    if not master_connection_string:
+        _db_ensured = True
+        return
+    try:
+        with open(_INIT_LOCK_PATH, "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            conn = pyodbc.connect(master_connection_string)
+            conn.autocommit = True
+            cursor = conn.cursor()
+            # Single round-trip: create only when missing
+            cursor.execute("IF DB_ID(N'TodoDB') IS NULL CREATE DATABASE TodoDB")
+            cursor.close()
+            conn.close()
+        _db_ensured = True
+    except Exception as e:
+        print(f"Error ensuring database exists: {e}")
+
+# Create SQLAlchemy async engine with a bounded connection pool.
+# SQL echoing is only enabled when DEBUG=1 — logging every statement is a
+# significant per-query cost in production.
+DATABASE_URL = f"mssql+aioodbc:///?odbc_connect={quote_plus(connection_string)}"
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=os.getenv("DEBUG") == "1",
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    max_overflow=20,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # Batches multi-row inserts into a single ODBC call
+    fast_executemany=True,
+    # Roomy compiled-statement cache so the fixed CRUD statements never
+    # age out and recompile under mixed traffic
+    query_cache_size=1200,
+)
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 # Create Base class
 Base = declarative_base()
 
-def get_db():
+async def get_db():
     """
-    Provide a database session to API endpoints.
+    Provide an async database session to API endpoints.
 
-    This function is a dependency that creates a new SQLAlchemy session
+    This function is a dependency that creates a new SQLAlchemy AsyncSession
     for each request and ensures it's properly closed after the request
     is completed. It uses FastAPI's dependency injection system.
 
     Yields:
-        Session: A SQLAlchemy database session instance.
+        AsyncSession: A SQLAlchemy async database session instance.
 
     Examples:
         >>> from fastapi import Depends
         >>> @app.get("/todos")
-        >>> def get_todos(db: Session = Depends(get_db)):
-        >>>     return db.query(Todo).all()
+        >>> async def get_todos(db: AsyncSession = Depends(get_db)):
+        >>>     return await crud.get_todos(db)
 
     Notes:
-        - The session is automatically committed if no exceptions occur
-        - The session is always closed in the finally block
+        - The session is always closed when the request completes
         - Should be used with FastAPI's Depends() for dependency injection
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -11,17 +11,12 @@ Attributes:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-import sys
-from pathlib import Path
+import asyncio
+import os
 
-# Ensure the project `backend` directory is on sys.path so `import app.*` works
-_project_root = Path(__file__).resolve().parents[1]  # backend/
-_root_str = str(_project_root)
-if _root_str not in sys.path:
-    sys.path.insert(0, _root_str)
-
-from app.database import engine, Base #, ensure_database_exists
+from app.database import engine, Base, ensure_database_exists
 from app.routers import todos
 from app import auth
 
@@ -43,14 +38,27 @@ async def lifespan(app: FastAPI):
         This function is automatically called by FastAPI and should not be
         invoked directly. It's registered with the FastAPI app during initialization.
     """
-    # Ensure database exists before creating tables
-    #ensure_database_exists()
-    # Create database tables on startup
-    Base.metadata.create_all(bind=engine)
+    # Create database tables on startup. Set AUTO_CREATE_TABLES=0 in
+    # production deploys that manage the schema through migrations, so
+    # workers don't each issue INFORMATION_SCHEMA checks before serving.
+    if os.getenv("AUTO_CREATE_TABLES", "1") == "1":
+        # Ensure database exists before creating tables; pyodbc is
+        # blocking, so run it off the event loop
+        await asyncio.to_thread(ensure_database_exists)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, checkfirst=True)
+    # Log the engine identity so duplicate engines (and pools) are easy
+    # to spot across workers
+    print(f"Database engine ready (id={id(engine)})")
     yield
 
 # Initialize FastAPI app
-app = FastAPI(title="Todo API", lifespan=lifespan)
+app = FastAPI(title="Todo API", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Authenticate bearer tokens once per request at the ASGI layer.
+# Registered before CORS so the CORS middleware stays outermost and
+# preflight requests are answered without hitting the auth check.
+app.add_middleware(auth.JWTAuthMiddleware)
 
 # Configure CORS
 app.add_middleware(
@@ -60,8 +68,10 @@ app.add_middleware(
             "https://dstodoapp-ezbre0c5cmaba0eg.canadacentral-01.azurewebsites.net",
         ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists keep the middleware on its set-membership fast path
+    # instead of expanding wildcards per request
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
 )
 
 # Include routers
@@ -86,3 +96,18 @@ def read_root():
         {'message': 'Todo API is running'}
     """
     return {"message": "Todo API is running"}
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools replace the pure-Python event loop and HTTP
+    # parser with C implementations (both ship with uvicorn[standard])
+    uvicorn.run(
+        "app.main:app",
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        limit_concurrency=1000,
+        timeout_keep_alive=75,
+        access_log=False,
+    )
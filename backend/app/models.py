@@ -8,7 +8,7 @@ Classes:
     Todo: SQLAlchemy model representing a todo item in the database.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -23,7 +23,7 @@ class Todo(Base):
     Attributes:
         id (int): Primary key identifier for the todo item.
         title (str): Title of the todo item (max 200 characters, required).
-        description (str): Optional detailed description of the todo item.
+        description (str): Optional detailed description (max 2000 characters).
         is_completed (bool): Completion status of the todo (default: False).
         created_at (datetime): Timestamp when the todo was created (auto-generated).
 
@@ -40,6 +40,13 @@ class Todo(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
-    description = Column(Text, nullable=True)
+    # Bounded so rows stay in-page instead of spilling to LOB storage
+    description = Column(String(2000), nullable=True)
     is_completed = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Matches the list query's ORDER BY so pagination reads the index in
+    # order instead of sorting the whole table
+    __table_args__ = (
+        Index("ix_todos_created_at_id", created_at.desc(), id.desc()),
+    )
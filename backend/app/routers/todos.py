@@ -13,55 +13,115 @@ Endpoints:
     GET /: Retrieve all todo items.
     GET /{todo_id}: Retrieve a specific todo item by ID.
     POST /: Create a new todo item.
+    POST /bulk: Create multiple todo items in one request.
     PUT /{todo_id}: Update an existing todo item.
     DELETE /{todo_id}: Delete a todo item.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import hashlib
+import orjson
 from app import crud, schemas
-from app.database import get_db
-from app.auth import require_auth
-
-router = APIRouter(dependencies=[Depends(require_auth)])
-#router = APIRouter()
-
-@router.get("/", response_model=List[schemas.TodoResponse])
-def read_todos(db: Session = Depends(get_db)):
+from app.database import get_db, SessionLocal
+
+# Authentication is enforced by JWTAuthMiddleware in main.py
+router = APIRouter()
+
+# Built once at import; pydantic-core serializes straight to JSON bytes,
+# skipping FastAPI's jsonable_encoder + response-model re-validation
+_LIST_ADAPTER = TypeAdapter(List[schemas.TodoResponse])
+_ITEM_ADAPTER = TypeAdapter(schemas.TodoResponse)
+
+# Short-TTL cache of pre-serialized responses for the read endpoints,
+# keyed by todo id (storing (payload, etag)) or ("list", limit, cursor)
+# (storing the payload bytes). A hit skips
+# the database round-trip and the serialization entirely; mutations
+# invalidate below and entries age out after 5 seconds regardless. All
+# access happens on the event loop, so no lock is needed.
+_response_cache = TTLCache(maxsize=1024, ttl=5)
+
+def _invalidate_response_cache(todo_id=None):
+    """Drop the cached bytes for one todo (if given) and all list pages."""
+    if todo_id is not None:
+        _response_cache.pop(todo_id, None)
+    for key in [k for k in _response_cache if isinstance(k, tuple)]:
+        _response_cache.pop(key, None)
+
+async def _create_todo_in_background(todo: schemas.TodoCreate):
+    """Insert a todo on its own session after the response is sent."""
+    async with SessionLocal() as db:
+        await crud.create_todo(db, todo)
+    _invalidate_response_cache()
+
+@router.get("/")
+async def read_todos(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db),
+):
     """
-    Retrieve all todo items.
+    Retrieve a page of todo items.
 
-    Fetches and returns a list of all todo items from the database,
-    ordered by creation date (newest first).
+    Fetches and returns a page of todo items from the database, ordered
+    by creation date (newest first) and selected by keyset: pass the
+    next_cursor of the previous response to get the following page. The
+    page size is capped at 200 items so responses stay bounded as the
+    table grows.
 
     Args:
-        db (Session): Database session injected by FastAPI's dependency system.
+        limit (int): Maximum number of items to return (1-200, default 50).
+        cursor (Optional[int]): Id of the last item of the previous page,
+                                or omitted for the first page.
+        db (AsyncSession): Database session injected by FastAPI's dependency system.
 
     Returns:
-        list[schemas.TodoResponse]: List of all todo items with their details.
+        dict: The requested page of todo items.
+            - items (list[schemas.TodoResponse]): The page of todos.
+            - next_cursor (int | None): Cursor for the next page, or None
+              when this page was empty.
 
     Examples:
-        >>> # GET /api/todos/
-        >>> # Response: [
-        >>> #   {"id": 1, "title": "Task 1", "description": "...", ...},
-        >>> #   {"id": 2, "title": "Task 2", "description": "...", ...}
-        >>> # ]
+        >>> # GET /api/todos/?limit=50
+        >>> # Response: {
+        >>> #   "items": [{"id": 9, "title": "Task 9", ...}, ...],
+        >>> #   "next_cursor": 3
+        >>> # }
     """
-    todos = crud.get_todos(db)
-    return todos
-
-@router.get("/{todo_id}", response_model=schemas.TodoResponse)
-def read_todo(todo_id: int, db: Session = Depends(get_db)):
+    cache_key = ("list", limit, cursor)
+    payload = _response_cache.get(cache_key)
+    if payload is None:
+        todos = await crud.get_todos(db, limit=limit, cursor=cursor)
+        payload = orjson.dumps({
+            "items": _LIST_ADAPTER.dump_python(
+                _LIST_ADAPTER.validate_python(todos), mode="json", exclude_none=True
+            ),
+            "next_cursor": todos[-1].id if todos else None,
+        })
+        _response_cache[cache_key] = payload
+    return Response(payload, media_type="application/json")
+
+@router.get("/{todo_id}")
+async def read_todo(
+    todo_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
     """
     Retrieve a specific todo item by its ID.
 
     Fetches a single todo item from the database using its unique identifier.
-    Returns a 404 error if the todo item is not found.
+    Responses carry a weak ETag; when the client sends a matching
+    If-None-Match header, a bodiless 304 is returned instead. Returns a
+    404 error if the todo item is not found.
 
     Args:
         todo_id (int): The unique identifier of the todo item to retrieve.
-        db (Session): Database session injected by FastAPI's dependency system.
+        request (Request): The incoming request (read for If-None-Match).
+        db (AsyncSession): Database session injected by FastAPI's dependency system.
 
     Returns:
         schemas.TodoResponse: The requested todo item with all its details.
@@ -76,26 +136,49 @@ def read_todo(todo_id: int, db: Session = Depends(get_db)):
         >>> # GET /api/todos/999 (non-existent)
         >>> # Response: 404 {"detail": "Todo not found"}
     """
-    todo = crud.get_todo_by_id(db, todo_id)
-    if todo is None:
-        raise HTTPException(status_code=404, detail="Todo not found")
-    return todo
-
-@router.post("/", response_model=schemas.TodoResponse, status_code=201)
-def create_todo(todo: schemas.TodoCreate, db: Session = Depends(get_db)):
+    cached = _response_cache.get(todo_id)
+    if cached is None:
+        todo = await crud.get_todo_by_id(db, todo_id)
+        if todo is None:
+            raise HTTPException(status_code=404, detail="Todo not found")
+        payload = _ITEM_ADAPTER.dump_json(
+            _ITEM_ADAPTER.validate_python(todo), exclude_none=True
+        )
+        # Derived from the serialized body so any field change (updates
+        # included) produces a new validator
+        etag = f'W/"{hashlib.md5(payload).hexdigest()}"'
+        cached = (payload, etag)
+        _response_cache[todo_id] = cached
+    payload, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(payload, media_type="application/json", headers={"ETag": etag})
+
+@router.post("/", response_model=schemas.TodoResponse, response_model_exclude_none=True, status_code=201)
+async def create_todo(
+    todo: schemas.TodoCreate,
+    background_tasks: BackgroundTasks,
+    async_write: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Create a new todo item.
 
     Accepts todo data in the request body and creates a new todo item
     in the database. Returns the created todo with its generated ID
-    and default values.
+    and default values. With ?async_write=true the insert is deferred
+    to a background task and the request returns 202 immediately, for
+    clients that don't need the generated ID.
 
     Args:
         todo (schemas.TodoCreate): The todo data to create (title and description).
-        db (Session): Database session injected by FastAPI's dependency system.
+        background_tasks (BackgroundTasks): Task queue for deferred writes.
+        async_write (bool): When true, enqueue the insert and return 202.
+        db (AsyncSession): Database session injected by FastAPI's dependency system.
 
     Returns:
-        schemas.TodoResponse: The newly created todo item with all fields.
+        schemas.TodoResponse: The newly created todo item with all fields,
+                              or an empty 202 response when async_write is set.
 
     Examples:
         >>> # POST /api/todos/
@@ -108,10 +191,43 @@ def create_todo(todo: schemas.TodoCreate, db: Session = Depends(get_db)):
         >>> #   "created_at": "2026-02-04T07:49:05.197Z"
         >>> # }
     """
-    return crud.create_todo(db, todo)
+    if async_write:
+        background_tasks.add_task(_create_todo_in_background, todo)
+        return Response(status_code=202)
+    created = await crud.create_todo(db, todo)
+    _invalidate_response_cache()
+    return schemas.TodoResponse.model_validate(created)
+
+@router.post("/bulk", response_model=List[schemas.TodoResponse], response_model_exclude_none=True, status_code=201)
+async def create_todos_bulk(todos: List[schemas.TodoCreate], db: AsyncSession = Depends(get_db)):
+    """
+    Create multiple todo items in one request.
+
+    Accepts a list of todos in the request body and inserts them all in
+    a single database round-trip with one commit. Returns the created
+    todos with their generated IDs and default values.
+
+    Args:
+        todos (List[schemas.TodoCreate]): The todo items to create.
+        db (AsyncSession): Database session injected by FastAPI's dependency system.
+
+    Returns:
+        list[schemas.TodoResponse]: The newly created todo items.
+
+    Examples:
+        >>> # POST /api/todos/bulk
+        >>> # Request body: [
+        >>> #   {"title": "Task 1"},
+        >>> #   {"title": "Task 2", "description": "Details"}
+        >>> # ]
+        >>> # Response: [{"id": 3, ...}, {"id": 4, ...}]
+    """
+    created = await crud.create_todos_bulk(db, todos)
+    _invalidate_response_cache()
+    return [schemas.TodoResponse.model_validate(t) for t in created]
 
-@router.put("/{todo_id}", response_model=schemas.TodoResponse)
-def update_todo(todo_id: int, todo: schemas.TodoUpdate, db: Session = Depends(get_db)):
+@router.put("/{todo_id}", response_model=schemas.TodoResponse, response_model_exclude_none=True)
+async def update_todo(todo_id: int, todo: schemas.TodoUpdate, db: AsyncSession = Depends(get_db)):
     """
     Update an existing todo item.
 
@@ -122,7 +238,7 @@ def update_todo(todo_id: int, todo: schemas.TodoUpdate, db: Session = Depends(ge
     Args:
         todo_id (int): The unique identifier of the todo item to update.
         todo (schemas.TodoUpdate): The fields to update (all optional).
-        db (Session): Database session injected by FastAPI's dependency system.
+        db (AsyncSession): Database session injected by FastAPI's dependency system.
 
     Returns:
         schemas.TodoResponse: The updated todo item with all its details.
@@ -138,13 +254,14 @@ def update_todo(todo_id: int, todo: schemas.TodoUpdate, db: Session = Depends(ge
         >>> # PUT /api/todos/999 (non-existent)
         >>> # Response: 404 {"detail": "Todo not found"}
     """
-    db_todo = crud.update_todo(db, todo_id, todo)
+    db_todo = await crud.update_todo(db, todo_id, todo)
     if db_todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
-    return db_todo
+    _invalidate_response_cache(todo_id)
+    return schemas.TodoResponse.model_validate(db_todo)
 
-@router.delete("/{todo_id}", response_model=schemas.TodoResponse)
-def delete_todo(todo_id: int, db: Session = Depends(get_db)):
+@router.delete("/{todo_id}", response_model=schemas.TodoResponse, response_model_exclude_none=True)
+async def delete_todo(todo_id: int, db: AsyncSession = Depends(get_db)):
     """
     Delete a todo item.
 
@@ -153,7 +270,7 @@ def delete_todo(todo_id: int, db: Session = Depends(get_db)):
 
     Args:
         todo_id (int): The unique identifier of the todo item to delete.
-        db (Session): Database session injected by FastAPI's dependency system.
+        db (AsyncSession): Database session injected by FastAPI's dependency system.
 
     Returns:
         schemas.TodoResponse: The deleted todo item with all its details.
@@ -172,7 +289,8 @@ def delete_todo(todo_id: int, db: Session = Depends(get_db)):
         - The deletion is permanent and cannot be undone
         - The deleted todo data is returned in the response
     """
-    db_todo = crud.delete_todo(db, todo_id)
+    db_todo = await crud.delete_todo(db, todo_id)
     if db_todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
-    return db_todo
+    _invalidate_response_cache(todo_id)
+    return schemas.TodoResponse.model_validate(db_todo)
@@ -12,7 +12,7 @@ Classes:
     TodoResponse: Schema for todo item API responses.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional
 
@@ -24,16 +24,17 @@ class TodoBase(BaseModel):
     containing the core attributes that are shared across different operations.
 
     Attributes:
-        title (str): The title of the todo item (required).
-        description (Optional[str]): Optional detailed description of the todo.
+        title (str): The title of the todo item (required, 1-200 characters).
+        description (Optional[str]): Optional detailed description of the
+                                     todo (max 2000 characters).
 
     Examples:
         >>> todo_data = TodoBase(title="Complete project", description="Finish by Friday")
         >>> print(todo_data.title)
         'Complete project'
     """
-    title: str
-    description: Optional[str] = None
+    title: str = Field(min_length=1, max_length=200)
+    description: Optional[str] = Field(default=None, max_length=2000)
 
 class TodoCreate(TodoBase):
     """
@@ -49,7 +50,8 @@ class TodoCreate(TodoBase):
         >>> new_todo = TodoCreate(title="Write documentation")
         >>> # This schema is typically used automatically by FastAPI
     """
-    pass
+    # Rejecting unknown fields keeps validation on pydantic's fast path
+    model_config = ConfigDict(extra="forbid")
 
 class TodoUpdate(BaseModel):
     """
@@ -67,8 +69,10 @@ class TodoUpdate(BaseModel):
         >>> update_data = TodoUpdate(is_completed=True)
         >>> # Only the completion status will be updated
     """
-    title: Optional[str] = None
-    description: Optional[str] = None
+    model_config = ConfigDict(extra="forbid")
+
+    title: Optional[str] = Field(default=None, min_length=1, max_length=200)
+    description: Optional[str] = Field(default=None, max_length=2000)
     is_completed: Optional[bool] = None
 
 class TodoResponse(TodoBase):
@@ -88,11 +92,10 @@ class TodoResponse(TodoBase):
 
     Examples:
         >>> # This schema is automatically used by FastAPI for response serialization
-        >>> # response = TodoResponse.from_orm(db_todo)
+        >>> # response = TodoResponse.model_validate(db_todo)
     """
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     is_completed: bool
     created_at: datetime
-
-    class Config:
-        from_attributes = True
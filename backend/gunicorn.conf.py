@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the Todo API.
+
+Runs the app under uvicorn workers (which pick up uvloop and httptools
+from uvicorn[standard]) with the standard 2n+1 worker count so all
+cores serve requests. Start with: gunicorn app.main:app
+
+Note: keep DB_POOL_SIZE x workers within the database's connection
+limit.
+"""
+
+import multiprocessing
+
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = 2 * multiprocessing.cpu_count() + 1
+# Long keep-alive so clients reuse connections instead of paying TCP
+# setup per request; make sure the reverse proxy forwards keep-alive too
+keepalive = 75
+# No per-request access logging on the hot path; errors still go to stderr
+accesslog = None
@@ -5,6 +5,7 @@ import { fetchTodos, createTodo, updateTodo, deleteTodo } from '../services/api'
 
 function TodoList() {
   const [todos, setTodos] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
 
   useEffect(() => {
     loadTodos();
@@ -12,7 +13,14 @@ function TodoList() {
 
   const loadTodos = async () => {
     const data = await fetchTodos();
-    setTodos(data);
+    setTodos(data.items);
+    setNextCursor(data.next_cursor);
+  };
+
+  const loadMore = async () => {
+    const data = await fetchTodos(nextCursor);
+    setTodos((prev) => [...prev, ...data.items]);
+    setNextCursor(data.next_cursor);
   };
 
   const handleCreate = async (todoData) => {
@@ -45,6 +53,14 @@ function TodoList() {
             />
           ))}
         </div>
+        {nextCursor && (
+          <button
+            onClick={loadMore}
+            className="w-full mt-4 py-2 bg-gray-200 text-gray-700 rounded hover:bg-gray-300"
+          >
+            Load more
+          </button>
+        )}
       </div>
     </div>
   );
@@ -9,8 +9,10 @@ function authHeaders() {
   return token ? { Authorization: `Bearer ${token}` } : {};
 }
 
-export const fetchTodos = async () => {
-  const response = await axios.get(API_URL, { headers: authHeaders() });
+export const fetchTodos = async (cursor = null) => {
+  const params = cursor ? { cursor } : {};
+  const response = await axios.get(API_URL, { headers: authHeaders(), params });
+  // { items, next_cursor }
   return response.data;
 };
 